@@ -1,7 +1,17 @@
+import functools
+import mmap
 import random
+import re
+import string
+import sys
 import time
 from enum import Enum
-from typing import List, Set
+from typing import Dict, FrozenSet, List, Optional, Sequence
+
+try:
+    from marisa_trie import Trie
+except ImportError:  # pragma: no cover - marisa-trie is optional
+    Trie = None
 
 
 class GameLevel(Enum):
@@ -9,135 +19,270 @@ class GameLevel(Enum):
     INTERMEDIATE = "intermediate"
 
 
+_ASCII_LOWER = bytes.maketrans(string.ascii_uppercase.encode(),
+                               string.ascii_lowercase.encode())
+# Splits on newlines together with surrounding whitespace, so blank lines and
+# stray spaces or carriage returns never reach the dictionary
+_LINE_BREAK = re.compile(r'\s*\n\s*')
+
+
+def _read_dictionary_file(path: str) -> bytes:
+    with open(path, 'rb', buffering=1 << 16) as file:
+        try:
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, TypeError):
+            # Empty files can't be mapped, and patched file objects have no real fileno
+            return file.read()
+        try:
+            return bytes(mm)
+        finally:
+            mm.close()
+
+
+def _parse_dictionary(data: bytes) -> List[str]:
+    text = data.translate(_ASCII_LOWER).decode('utf-8')
+    # Guesses and the display buffer are ASCII-only, so other entries can't be played
+    return [entry for entry in _LINE_BREAK.split(text.strip())
+            if entry and entry.isascii()]
+
+
+def _build_dictionary(entries: Sequence[str]) -> Sequence[str]:
+    # A MARISA-trie stores large dictionaries far more compactly than a tuple of str.
+    # It keeps one copy of each entry in its own key order, so duplicate lines no
+    # longer weight sampling; the tuple fallback keeps file order and duplicates.
+    if Trie is not None:
+        return Trie(entries)
+    return tuple(entries)
+
+
+def _dictionary_entry(dictionary: Sequence[str], index: int) -> str:
+    if Trie is not None and isinstance(dictionary, Trie):
+        return dictionary.restore_key(index)
+    return dictionary[index]
+
+
+# Dictionary file and built-in fallback entries for each level
+_LEVEL_SOURCES = {
+    GameLevel.BASIC: (
+        'data/words.txt',
+        ['python', 'programming', 'computer', 'algorithm', 'software'],
+    ),
+    GameLevel.INTERMEDIATE: (
+        'data/phrases.txt',
+        ['hello world', 'unit testing', 'software development'],
+    ),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_dict_cached(level: GameLevel) -> Sequence[str]:
+    path, fallback = _LEVEL_SOURCES[level]
+    try:
+        return _build_dictionary(_parse_dictionary(_read_dictionary_file(path)))
+    except FileNotFoundError:
+        return _build_dictionary(fallback)
+
+
+# Gallows rows indexed by lives lost
+_BODY_PARTS = ("  |   ", "  |  |", "  | /|", "  | /|\\", "  | /|\\", "  | /|\\", "  | /|\\")
+_LEG_PARTS = ("  |   ", "  |", "  |", "  |", "  | /", "  | / \\", "  | / \\")
+
+
+def _render(lives_lost: int) -> str:
+    hangman_parts = [
+        "  ____",
+        "  |  |",
+        "  |  O" if lives_lost >= 1 else "  |   ",
+        _BODY_PARTS[lives_lost],
+        _LEG_PARTS[lives_lost],
+        "__|__"
+    ]
+    return '\n'.join(hangman_parts)
+
+
+_DRAWINGS = tuple(_render(lives_lost) for lives_lost in range(len(_BODY_PARTS)))
+_DRAWINGS_BYTES = tuple(drawing.encode('ascii') for drawing in _DRAWINGS)
+
+_LOWER_OFFSET = 32
+
+
+def _letters_in_mask(mask: int) -> List[str]:
+    # Walking set bits from lowest to highest yields the letters in alphabetical order
+    letters = []
+    while mask:
+        low_bit = mask & -mask
+        letters.append(chr(96 + low_bit.bit_length()))
+        mask ^= low_bit
+    return letters
+
+
 class HangmanGame:
     def __init__(self, level: GameLevel):
         self.level = level
         self.max_lives = 6
         self.current_lives = 6
         self.time_limit = 15
-        self.guessed_letters: Set[str] = set()
+        self._guessed_mask = 0
+        self._wrong_mask = 0
         self.game_over = False
         self.won = False
         self.target_word = ""
-        self.display_word: List[str] = []
+        self._display = bytearray()
+        self._display_cache: Optional[str] = None
+        self._letter_positions: Dict[str, List[int]] = {}
+        self._blanks_remaining = 0
         self.start_time = 0
+        self._deadline = 0.0
         self.dictionary = self._load_dictionary()
-        self._select_target()
 
-    def _load_dictionary(self) -> List[str]:
-        try:
-            if self.level == GameLevel.BASIC:
-                with open('data/words.txt', 'r') as file:
-                    return [word.strip().lower() for word in file.readlines()]
-            else:
-                with open('data/phrases.txt', 'r') as file:
-                    return [phrase.strip().lower() for phrase in file.readlines()]
-        except FileNotFoundError:
-            fallback_words = ['python', 'programming', 'computer', 'algorithm', 'software']
-            fallback_phrases = ['hello world', 'unit testing', 'software development']
-            return fallback_words if self.level == GameLevel.BASIC else fallback_phrases
+    def _load_dictionary(self) -> Sequence[str]:
+        return _load_dict_cached(self.level)
 
     def _select_target(self):
-        self.target_word = random.choice(self.dictionary)
-        self.display_word = []
-        for char in self.target_word:
+        index = random.randrange(len(self.dictionary))
+        self.target_word = _dictionary_entry(self.dictionary, index)
+        if not self.target_word.isascii():
+            raise ValueError(f"Target '{self.target_word}' contains non-ASCII characters")
+        # Characters sit at even offsets with a space between each, so the
+        # buffer is already the rendered display string
+        self._display = bytearray(b' ') * (2 * len(self.target_word) - 1)
+        self._letter_positions = {}
+        for i, char in enumerate(self.target_word):
             if char.isalpha():
-                self.display_word.append('_')
+                self._display[2 * i] = ord('_')
+                self._letter_positions.setdefault(char, []).append(2 * i)
             else:
-                self.display_word.append(char)
+                self._display[2 * i] = ord(char)
+        self._display_cache = None
+        self._blanks_remaining = sum(1 for c in self.target_word if c.isalpha())
+
+    def _ensure_target(self):
+        # The target is picked on first use, so constructing a game is cheap
+        if not self.target_word:
+            self._select_target()
+
+    @property
+    def guessed_letters(self) -> FrozenSet[str]:
+        return frozenset(_letters_in_mask(self._guessed_mask))
+
+    @property
+    def display_word(self) -> List[str]:
+        self._ensure_target()
+        return list(self._display[::2].decode('ascii'))
 
     def start_timer(self):
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        self._deadline = self.start_time + self.time_limit
 
     def get_remaining_time(self) -> float:
-        if self.start_time == 0:
+        if self._deadline == 0:
             return self.time_limit
-        elapsed = time.time() - self.start_time
-        remaining = max(0, self.time_limit - elapsed)
-        return remaining
+        return max(0.0, self._deadline - time.monotonic())
 
     def is_time_up(self) -> bool:
-        return self.get_remaining_time() <= 0
+        return self._deadline != 0 and time.monotonic() >= self._deadline
 
-    def make_guess(self, letter: str) -> bool:
-        if len(letter) != 1 or not letter.isalpha():
+    def _normalize_guess(self, letter: str) -> str:
+        if len(letter) != 1:
             raise ValueError("Please enter a single letter")
 
-        letter = letter.lower()
+        code = ord(letter)
+        if 65 <= code <= 90:
+            return chr(code | _LOWER_OFFSET)
+        elif not 97 <= code <= 122:
+            raise ValueError("Please enter a single letter")
+        return letter
+
+    def make_guess(self, letter: str) -> bool:
+        letter = self._normalize_guess(letter)
+        bit = 1 << (ord(letter) - 97)
 
-        if letter in self.guessed_letters:
+        if self._guessed_mask & bit:
             raise ValueError(f"Letter '{letter}' has already been guessed")
 
-        self.guessed_letters.add(letter)
+        self._ensure_target()
+        return self._apply_guess(letter, bit)
 
-        if letter in self.target_word:
-            for i, char in enumerate(self.target_word):
-                if char == letter:
-                    self.display_word[i] = letter
+    def make_guesses(self, letters: str) -> Dict[str, bool]:
+        # Results are keyed by letter in the order applied; letters already guessed,
+        # repeated, or left over once the game ends are not applied and have no entry
+        normalized = [self._normalize_guess(letter) for letter in letters]
 
-            if self.is_won():
+        self._ensure_target()
+        results = {}
+        for letter in normalized:
+            if self.game_over:
+                break
+            bit = 1 << (ord(letter) - 97)
+            if self._guessed_mask & bit:
+                continue
+            results[letter] = self._apply_guess(letter, bit)
+        return results
+
+    def _apply_guess(self, letter: str, bit: int) -> bool:
+        self._guessed_mask |= bit
+        positions = self._letter_positions.get(letter)
+        if positions:
+            code = ord(letter)
+            for i in positions:
+                self._display[i] = code
+            self._display_cache = None
+            self._blanks_remaining -= len(positions)
+
+            if self._blanks_remaining == 0:
                 self.won = True
                 self.game_over = True
 
             return True
         else:
+            self._wrong_mask |= bit
             self.current_lives -= 1
             if self.current_lives <= 0:
                 self.game_over = True
             return False
 
     def is_won(self) -> bool:
-        return '_' not in self.display_word
+        self._ensure_target()
+        return self._blanks_remaining == 0
 
     def is_game_over(self) -> bool:
-        return self.game_over or self.is_time_up() or self.current_lives <= 0
+        return self.game_over or self.current_lives <= 0 or self.is_time_up()
 
     def get_display_string(self) -> str:
-        return ' '.join(self.display_word)
+        self._ensure_target()
+        if self._display_cache is None:
+            self._display_cache = self._display.decode('ascii')
+        return self._display_cache
+
+    def get_display_bytes(self) -> bytes:
+        self._ensure_target()
+        return bytes(self._display)
 
     def get_hangman_drawing(self) -> str:
-        hangman_parts = [
-            "  ____",
-            "  |  |",
-            "  |  O" if self.max_lives - self.current_lives >= 1 else "  |   ",
-            self._get_body_part(),
-            self._get_legs_part(),
-            "__|__"
-        ]
+        return _DRAWINGS[self._frame_index()] + self._get_drawing_caption()
 
-        drawing = '\n'.join(hangman_parts)
-        drawing += f"\n\nLives remaining: {self.current_lives}"
+    def get_hangman_drawing_bytes(self) -> bytes:
+        return _DRAWINGS_BYTES[self._frame_index()] + self._get_drawing_caption().encode('ascii')
 
-        wrong_guesses = [letter for letter in self.guessed_letters
-                         if letter not in self.target_word]
-        if wrong_guesses:
-            drawing += f"\nWrong guesses: {', '.join(sorted(wrong_guesses))}"
+    def _frame_index(self) -> int:
+        return max(0, min(self.max_lives - self.current_lives, len(_DRAWINGS) - 1))
 
-        return drawing
+    def _get_drawing_caption(self) -> str:
+        caption = f"\n\nLives remaining: {self.current_lives}"
+
+        if self._wrong_mask:
+            caption += f"\nWrong guesses: {', '.join(_letters_in_mask(self._wrong_mask))}"
+
+        return caption
 
     def _get_body_part(self) -> str:
-        lives_lost = self.max_lives - self.current_lives
-        if lives_lost >= 3:
-            return "  | /|\\"
-        elif lives_lost >= 2:
-            return "  | /|"
-        elif lives_lost >= 1:
-            return "  |  |"
-        else:
-            return "  |   "
+        return _BODY_PARTS[self._frame_index()]
 
     def _get_legs_part(self) -> str:
-        lives_lost = self.max_lives - self.current_lives
-        if lives_lost >= 5:
-            return "  | / \\"
-        elif lives_lost >= 4:
-            return "  | /"
-        elif lives_lost >= 1:
-            return "  |"
-        else:
-            return "  |   "
+        return _LEG_PARTS[self._frame_index()]
 
     def get_game_status(self) -> str:
+        self._ensure_target()
         if self.won:
             return f"Congratulations! You guessed the word: '{self.target_word}'"
         elif self.is_time_up():
@@ -150,13 +295,36 @@ class HangmanGame:
 
     def reset_game(self):
         self.current_lives = self.max_lives
-        self.guessed_letters = set()
+        self._guessed_mask = 0
+        self._wrong_mask = 0
         self.game_over = False
         self.won = False
         self.start_time = 0
+        self._deadline = 0.0
         self._select_target()
 
 
+def _render_frame(game: HangmanGame) -> bytes:
+    # The gallows and display are already bytes; only the drawing caption
+    # and status line are encoded per frame
+    return b''.join([
+        b'\n', game.get_hangman_drawing_bytes(),
+        b'\nWord: ', game.get_display_bytes(),
+        b'\n', game.get_game_status().encode(),
+    ])
+
+
+def _write_frame(frame: bytes):
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        print(frame.decode())
+        return
+    # Flush pending print() output first so the frame lands after it
+    sys.stdout.flush()
+    buffer.write(frame + b'\n')
+    buffer.flush()
+
+
 def main():
     print("Welcome to Hangman Game!")
     print("Choose difficulty level:")
@@ -182,9 +350,7 @@ def main():
 
     while True:
         game.start_timer()
-        print(f"\n{game.get_hangman_drawing()}")
-        print(f"Word: {game.get_display_string()}")
-        print(game.get_game_status())
+        _write_frame(_render_frame(game))
 
         if game.is_game_over():
             play_again = input("\nWould you like to play again? (y/n): ")
@@ -1,7 +1,17 @@
+import io
+import sys
 import pytest
 import time
 from unittest.mock import patch, mock_open
-from src.hangman import HangmanGame, GameLevel
+from src.hangman import (HangmanGame, GameLevel, _build_dictionary, _dictionary_entry,
+                         _load_dict_cached, _render_frame, _write_frame)
+
+
+@pytest.fixture(autouse=True)
+def clear_dictionary_cache():
+    _load_dict_cached.cache_clear()
+    yield
+    _load_dict_cached.cache_clear()
 
 
 class TestHangmanGame:
@@ -21,7 +31,7 @@ class TestHangmanGame:
         assert game.max_lives == 6
         assert game.current_lives == 6
 
-    @patch('builtins.open', mock_open(read_data='apple\norange\nbanana'))
+    @patch('builtins.open', mock_open(read_data=b'apple\norange\nbanana'))
     def test_load_words_basic_level(self):
         game = HangmanGame(GameLevel.BASIC)
         words = game._load_dictionary()
@@ -29,13 +39,59 @@ class TestHangmanGame:
         assert 'orange' in words
         assert 'banana' in words
 
-    @patch('builtins.open', mock_open(read_data='hello world\nunit testing'))
+    @patch('builtins.open', mock_open(read_data=b'hello world\nunit testing'))
     def test_load_phrases_intermediate_level(self):
         game = HangmanGame(GameLevel.INTERMEDIATE)
         phrases = game._load_dictionary()
         assert 'hello world' in phrases
         assert 'unit testing' in phrases
 
+    def test_load_dictionary_normalizes_file(self, tmp_path, monkeypatch):
+        (tmp_path / 'data').mkdir()
+        (tmp_path / 'data' / 'words.txt').write_bytes(b'Apple\r\n\nORANGE  \r\nbanana\n')
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr('src.hangman.Trie', None)
+
+        game = HangmanGame(GameLevel.BASIC)
+        assert game.dictionary == ('apple', 'orange', 'banana')
+
+    def test_dictionary_without_trie_keeps_order_and_duplicates(self, monkeypatch):
+        monkeypatch.setattr('src.hangman.Trie', None)
+        dictionary = _build_dictionary(['pear', 'apple', 'pear'])
+
+        assert dictionary == ('pear', 'apple', 'pear')
+        assert _dictionary_entry(dictionary, 2) == 'pear'
+
+    def test_dictionary_with_trie_deduplicates(self):
+        marisa_trie = pytest.importorskip('marisa_trie')
+        dictionary = _build_dictionary(['pear', 'apple', 'pear'])
+
+        assert isinstance(dictionary, marisa_trie.Trie)
+        entries = [_dictionary_entry(dictionary, i) for i in range(len(dictionary))]
+        assert sorted(entries) == ['apple', 'pear']
+
+    def test_load_dictionary_skips_non_ascii_entries(self, tmp_path, monkeypatch):
+        (tmp_path / 'data').mkdir()
+        (tmp_path / 'data' / 'phrases.txt').write_bytes(
+            'Café\ndon\u2019t stop\nhello world\n'.encode('utf-8'))
+        monkeypatch.chdir(tmp_path)
+
+        game = HangmanGame(GameLevel.INTERMEDIATE)
+        assert list(game.dictionary) == ['hello world']
+
+    def test_dictionary_shared_between_games(self):
+        first = HangmanGame(GameLevel.BASIC)
+        second = HangmanGame(GameLevel.BASIC)
+        assert first.dictionary is second.dictionary
+
+    def test_target_selected_on_first_use(self):
+        with patch.object(HangmanGame, '_load_dictionary', return_value=['apple']):
+            game = HangmanGame(GameLevel.BASIC)
+            assert game.target_word == ""
+
+            assert game.get_display_string() == "_ _ _ _ _"
+            assert game.target_word == 'apple'
+
     def test_select_word_basic_level(self):
         with patch.object(HangmanGame, '_load_dictionary', return_value=['apple', 'orange']):
             game = HangmanGame(GameLevel.BASIC)
@@ -43,6 +99,13 @@ class TestHangmanGame:
             assert game.target_word in ['apple', 'orange']
             assert game.display_word == ['_'] * len(game.target_word)
 
+    def test_select_target_uses_replaced_dictionary(self):
+        with patch.object(HangmanGame, '_load_dictionary', return_value=['apple', 'orange']):
+            game = HangmanGame(GameLevel.BASIC)
+            game.dictionary = ['zzz']
+            game._select_target()
+            assert game.target_word == 'zzz'
+
     def test_select_phrase_intermediate_level(self):
         with patch.object(HangmanGame, '_load_dictionary',
                           return_value=['hello world', 'unit testing']):
@@ -54,6 +117,13 @@ class TestHangmanGame:
                 expected_display.append('_' if char.isalpha() else char)
             assert game.display_word == expected_display
 
+    def test_select_non_ascii_target_rejected(self):
+        with patch.object(HangmanGame, '_load_dictionary', return_value=['rock\u2013paper']):
+            game = HangmanGame(GameLevel.INTERMEDIATE)
+
+            with pytest.raises(ValueError, match="non-ASCII"):
+                game._select_target()
+
     def test_valid_guess_correct_letter(self):
         with patch.object(HangmanGame, '_load_dictionary', return_value=['apple']):
             game = HangmanGame(GameLevel.BASIC)
@@ -76,6 +146,16 @@ class TestHangmanGame:
             assert 'z' not in game.display_word
             assert game.current_lives == 5
 
+    def test_guessed_letters_is_read_only(self):
+        with patch.object(HangmanGame, '_load_dictionary', return_value=['apple']):
+            game = HangmanGame(GameLevel.BASIC)
+            game._select_target()
+            game.make_guess('a')
+
+            assert game.guessed_letters == {'a'}
+            with pytest.raises(AttributeError):
+                game.guessed_letters.add('b')
+
     def test_invalid_guess_already_guessed(self):
         with patch.object(HangmanGame, '_load_dictionary', return_value=['apple']):
             game = HangmanGame(GameLevel.BASIC)
@@ -93,6 +173,75 @@ class TestHangmanGame:
             with pytest.raises(ValueError, match="Please enter a single letter"):
                 game.make_guess('123')
 
+    def test_guess_uppercase_letter_normalized(self):
+        with patch.object(HangmanGame, '_load_dictionary', return_value=['apple']):
+            game = HangmanGame(GameLevel.BASIC)
+            game._select_target()
+
+            assert game.make_guess('A') is True
+            assert 'a' in game.guessed_letters
+            with pytest.raises(ValueError, match="Letter 'a' has already been guessed"):
+                game.make_guess('a')
+
+    def test_invalid_guess_non_ascii_letter(self):
+        with patch.object(HangmanGame, '_load_dictionary', return_value=['apple']):
+            game = HangmanGame(GameLevel.BASIC)
+            game._select_target()
+
+            with pytest.raises(ValueError, match="Please enter a single letter"):
+                game.make_guess('é')
+
+    def test_make_guesses_batch(self):
+        with patch.object(HangmanGame, '_load_dictionary', return_value=['apple']):
+            game = HangmanGame(GameLevel.BASIC)
+            game._select_target()
+            game.make_guess('a')
+
+            results = game.make_guesses('aPzpq')
+            assert results == {'p': True, 'z': False, 'q': False}
+            assert game.guessed_letters == {'a', 'p', 'z', 'q'}
+            assert game.get_display_string() == "a p p _ _"
+            assert game.current_lives == 4
+
+    def test_make_guesses_validates_before_applying(self):
+        with patch.object(HangmanGame, '_load_dictionary', return_value=['apple']):
+            game = HangmanGame(GameLevel.BASIC)
+            game._select_target()
+
+            with pytest.raises(ValueError, match="Please enter a single letter"):
+                game.make_guesses('ap1')
+            assert game.guessed_letters == set()
+
+    def test_make_guesses_stops_when_won(self):
+        with patch.object(HangmanGame, '_load_dictionary', return_value=['cat']):
+            game = HangmanGame(GameLevel.BASIC)
+            game._select_target()
+
+            assert game.make_guesses('catxyz') == {'c': True, 'a': True, 't': True}
+            assert game.won is True
+            assert game.current_lives == 6
+
+    def test_make_guesses_on_finished_game(self):
+        with patch.object(HangmanGame, '_load_dictionary', return_value=['cat']):
+            game = HangmanGame(GameLevel.BASIC)
+            game._select_target()
+            game.make_guesses('cat')
+            guessed = game.guessed_letters
+
+            assert game.make_guesses('xyz') == {}
+            assert game.current_lives == 6
+            assert game.guessed_letters == guessed
+            assert "Wrong guesses" not in game.get_hangman_drawing()
+
+            game.reset_game()
+            game.make_guesses('uvwxyz')
+            assert game.current_lives == 0
+
+            assert game.make_guesses('bdc') == {}
+            assert game.current_lives == 0
+            assert game.guessed_letters == set('uvwxyz')
+            assert "Wrong guesses: u, v, w, x, y, z" in game.get_hangman_drawing()
+
     def test_game_won_condition(self):
         with patch.object(HangmanGame, '_load_dictionary', return_value=['cat']):
             game = HangmanGame(GameLevel.BASIC)
@@ -135,7 +284,7 @@ class TestHangmanGame:
             game._select_target()
             game.start_timer()
 
-            with patch('time.time', return_value=game.start_time + 16):
+            with patch('time.monotonic', return_value=game.start_time + 16):
                 assert game.is_time_up() is True
 
     def test_get_display_string_basic(self):
@@ -177,6 +326,65 @@ class TestHangmanGame:
             assert "Lives remaining: 5" in drawing
             assert "Wrong guesses: z" in drawing
 
+    def test_hangman_drawing_with_extra_lives(self):
+        with patch.object(HangmanGame, '_load_dictionary', return_value=['apple']):
+            game = HangmanGame(GameLevel.BASIC)
+            empty_gallows = game.get_hangman_drawing()
+
+            game.current_lives = 8
+            drawing = game.get_hangman_drawing()
+            assert drawing.replace("Lives remaining: 8", "Lives remaining: 6") == empty_gallows
+            assert game._get_body_part() == "  |   "
+            assert game._get_legs_part() == "  |   "
+
+    def test_wrong_guesses_listed_alphabetically(self):
+        with patch.object(HangmanGame, '_load_dictionary', return_value=['apple']):
+            game = HangmanGame(GameLevel.BASIC)
+            game._select_target()
+
+            for letter in ['z', 'b', 'a', 'q']:
+                game.make_guess(letter)
+
+            assert "Wrong guesses: b, q, z" in game.get_hangman_drawing()
+
+    def test_hangman_drawing_bytes_matches_text(self):
+        with patch.object(HangmanGame, '_load_dictionary', return_value=['apple']):
+            game = HangmanGame(GameLevel.BASIC)
+            game.make_guesses('zqa')
+
+            assert game.get_hangman_drawing_bytes().decode() == game.get_hangman_drawing()
+
+    def test_render_frame_matches_print_output(self, capsys):
+        with patch.object(HangmanGame, '_load_dictionary', return_value=['hello world']):
+            game = HangmanGame(GameLevel.INTERMEDIATE)
+            game.make_guess('o')
+            game.make_guess('z')
+
+            print(f"\n{game.get_hangman_drawing()}")
+            print(f"Word: {game.get_display_string()}")
+            print(game.get_game_status())
+            expected = capsys.readouterr().out
+
+            assert _render_frame(game).decode() + '\n' == expected
+
+    def test_write_frame_to_stdout_buffer(self, monkeypatch):
+        raw = io.BytesIO()
+        monkeypatch.setattr(sys, 'stdout', io.TextIOWrapper(raw, encoding='ascii'))
+
+        print("Good guess!")
+        _write_frame(b'frame')
+
+        assert raw.getvalue() == b'Good guess!\nframe\n'
+
+    def test_write_frame_without_stdout_buffer(self, monkeypatch):
+        fake_stdout = io.StringIO()
+        monkeypatch.setattr(sys, 'stdout', fake_stdout)
+
+        print("Good guess!")
+        _write_frame(b'frame')
+
+        assert fake_stdout.getvalue() == 'Good guess!\nframe\n'
+
     def test_reset_game(self):
         with patch.object(HangmanGame, '_load_dictionary', return_value=['apple']):
             game = HangmanGame(GameLevel.BASIC)
@@ -224,7 +432,7 @@ class TestHangmanGame:
             game.start_timer()
 
             # Mock time being up
-            with patch('time.time', return_value=game.start_time + 16):
+            with patch('time.monotonic', return_value=game.start_time + 16):
                 status = game.get_game_status()
                 assert "Time's up" in status
                 assert game.target_word in status